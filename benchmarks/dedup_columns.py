@@ -0,0 +1,83 @@
+"""Benchmark column deduplication against the transpose-based implementation.
+
+Run with: python -m benchmarks.dedup_columns
+"""
+
+import time
+import tracemalloc
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from src.data.utils import pandas as pandas_utils
+
+
+def drop_duplicate_columns_transposed(df: DataFrame) -> DataFrame:
+    """Previous implementation of drop_duplicate_columns."""
+    duplicates = df.T.duplicated()
+    return df.T[~duplicates].T
+
+
+def rename_duplicate_columns_looped(df: DataFrame) -> DataFrame:
+    """Previous implementation of rename_duplicate_columns."""
+    cols = pd.Series(df.columns)
+    for dup in df.columns[df.columns.duplicated(keep=False)]:
+        cols[df.columns.get_loc(dup)] = [
+            f"{dup}_{i}" if i != 0 else dup
+            for i in range(df.columns.get_loc(dup).sum())
+        ]
+    df.columns = cols
+    return df
+
+
+def get_wide_frame(n_rows: int = 50_000) -> DataFrame:
+    """Get a mixed-dtype frame with every fourth column duplicated."""
+    rng = np.random.default_rng(0)
+    columns = {f"float_{i}": rng.normal(size=n_rows) for i in range(150)}
+    columns |= {f"str_{i}": rng.choice(["a", "b", "c"], n_rows) for i in range(30)}
+    columns |= {f"int_{i}": rng.integers(0, 100, n_rows) for i in range(20)}
+    df = pd.DataFrame(columns)
+    df = pd.concat([df, df.iloc[:, ::4]], axis=1)
+    df.columns = [f"col_{i}" for i in range(df.shape[1])]
+    return df
+
+
+def measure(fn: Callable, df: DataFrame) -> tuple[DataFrame, float, float]:
+    """Run a function and get its result, wall time in seconds and peak memory in MB."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(df)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    df = get_wide_frame()
+    print(
+        f"Frame: {df.shape[0]} x {df.shape[1]}, "
+        f"{df.memory_usage(deep=True).sum() / 1e6:.0f} MB"
+    )
+    for name, fn in [
+        ("drop_duplicate_columns (transposed)", drop_duplicate_columns_transposed),
+        ("drop_duplicate_columns", pandas_utils.drop_duplicate_columns),
+    ]:
+        result, elapsed, peak = measure(fn, df)
+        dtypes = result.dtypes.astype(str).value_counts().to_dict()
+        print(f"{name}: {elapsed:.2f}s, peak {peak:.0f} MB, {result.shape[1]} {dtypes}")
+
+    labels = [f"x_{i % 1000}" for i in range(5000)]
+    wide = pd.DataFrame(np.zeros((2, len(labels))), columns=labels)
+    for name, fn in [
+        ("rename_duplicate_columns (looped)", rename_duplicate_columns_looped),
+        ("rename_duplicate_columns", pandas_utils.rename_duplicate_columns),
+    ]:
+        _, elapsed, peak = measure(fn, wide.copy())
+        print(f"{name}: {elapsed:.3f}s, peak {peak:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
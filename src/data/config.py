@@ -10,6 +10,7 @@ DATA_PATHS = {
     "DEBT_IND_FP": "data/wse_info/debt_ind.csv",
     "LIQUIDITY_IND_FP": "data/wse_info/liquidity_ind.csv",
     "ACTIVITY_IND_FP": "data/wse_info/activity_ind.csv",
+    "FUNDAMENTALS_STORE_DP": "data/wse_info/store",
     "CLEANED_DATA_FP": "data/preprocessed.csv",
     "FEATURIZED_DATA_FP": "data/featurized.csv",
 }
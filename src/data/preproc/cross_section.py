@@ -0,0 +1,150 @@
+import numpy as np
+import pandas as pd
+
+
+def get_group_offsets(keys: pd.Series | pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """Get the order sorting rows by group keys and the start offset of each group.
+
+    Rows of group `g` are `order[offsets[g]:offsets[g + 1]]`. Keys can be a single
+    column (e.g. date) or several columns (e.g. date and sector).
+    """
+    if isinstance(keys, pd.Series):
+        codes = pd.factorize(keys, sort=True, use_na_sentinel=False)[0]
+    else:
+        codes = keys.groupby(list(keys.columns), sort=True, dropna=False).ngroup()
+        codes = codes.to_numpy()
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    offsets = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    return order, offsets
+
+
+def _get_group_ids(offsets: np.ndarray, n: int) -> np.ndarray:
+    """Get the group id of each row from group start offsets."""
+    group_ids = np.zeros(n, dtype=np.int64)
+    group_ids[offsets[1:]] = 1
+    return np.cumsum(group_ids)
+
+
+def _sort_within_groups(values: np.ndarray, group_ids: np.ndarray) -> np.ndarray:
+    """Get the order sorting values within each group, NaNs last."""
+    return np.lexsort((values, group_ids))
+
+
+def rank_by_group(
+    values: np.ndarray, offsets: np.ndarray, ascending: bool = True
+) -> np.ndarray:
+    """Rank group-sorted values within each group.
+
+    Ties get the average rank and NaNs stay NaN, like `DataFrame.rank` does.
+    """
+    n = len(values)
+    ranks = np.full(n, np.nan)
+    if n == 0:
+        return ranks
+    group_ids = _get_group_ids(offsets, n)
+    keyed = values if ascending else -values
+    order = _sort_within_groups(keyed, group_ids)
+    sorted_values = keyed[order]
+    sorted_groups = group_ids[order]
+    block_starts = np.r_[
+        True,
+        (sorted_groups[1:] != sorted_groups[:-1])
+        | (sorted_values[1:] != sorted_values[:-1]),
+    ]
+    starts = np.flatnonzero(block_starts)
+    ends = np.r_[starts[1:], n]
+    block_ids = np.cumsum(block_starts) - 1
+    avg_position = (starts + ends - 1) / 2
+    sorted_ranks = avg_position[block_ids] - offsets[sorted_groups] + 1
+    sorted_ranks[np.isnan(sorted_values)] = np.nan
+    ranks[order] = sorted_ranks
+    return ranks
+
+
+def zscore_by_group(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Standardize group-sorted values within each group, ignoring NaNs."""
+    n = len(values)
+    if n == 0:
+        return np.full(n, np.nan)
+    valid = ~np.isnan(values)
+    counts = np.add.reduceat(valid.astype(np.int64), offsets)
+    sums = np.add.reduceat(np.where(valid, values, 0.0), offsets)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+        deviations = values - np.repeat(means, np.diff(np.r_[offsets, n]))
+        squares = np.add.reduceat(np.where(valid, deviations**2, 0.0), offsets)
+        stds = np.sqrt(squares / (counts - 1))
+        return deviations / np.repeat(stds, np.diff(np.r_[offsets, n]))
+
+
+def winsorize_by_group(
+    values: np.ndarray, offsets: np.ndarray, outlier_cutoff: float = 0.01
+) -> np.ndarray:
+    """Clip group-sorted values at per-group quantiles.
+
+    Values can be a (rows, columns) array to winsorize many columns at once. Quantiles
+    are linearly interpolated like `Series.quantile` does.
+    """
+    n = len(values)
+    if n == 0:
+        return values.copy()
+    ends = np.r_[offsets[1:], n]
+    sorted_values = np.empty_like(values)
+    for start, end in zip(offsets, ends):
+        sorted_values[start:end] = np.sort(values[start:end], axis=0)
+    counts = np.add.reduceat((~np.isnan(values)).astype(np.int64), offsets, axis=0)
+    starts = offsets.reshape((-1,) + (1,) * (values.ndim - 1))
+
+    def group_quantile(q: float) -> np.ndarray:
+        position = q * np.maximum(counts - 1, 0)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        lower_values = np.take_along_axis(sorted_values, starts + lower, axis=0)
+        upper_values = np.take_along_axis(sorted_values, starts + upper, axis=0)
+        quantiles = lower_values + (upper_values - lower_values) * (position - lower)
+        return np.where(counts > 0, quantiles, np.nan)
+
+    lower_bounds = np.repeat(group_quantile(outlier_cutoff), ends - offsets, axis=0)
+    upper_bounds = np.repeat(group_quantile(1 - outlier_cutoff), ends - offsets, axis=0)
+    return np.clip(values, lower_bounds, upper_bounds)
+
+
+def get_cross_sectional_features(
+    df: pd.DataFrame,
+    rank_cols: list = [],
+    zscore_cols: list = [],
+    winsorize_cols: list = [],
+    by: str | list = "date",
+    ascending: bool | dict = True,
+    outlier_cutoff: float = 0.01,
+) -> pd.DataFrame:
+    """Get per-date cross-sectional ranks, z-scores and winsorized values.
+
+    Rows are sorted by the group keys once and every column is processed on the
+    sorted arrays, with all winsorized columns handled together. Ranks and z-scores are
+    added as `<col>_rank` and `<col>_zscore`, winsorized columns are overwritten. Pass
+    e.g. `by=["date", "sector"]` to get sector-neutral features. `ascending` applies to
+    all rank columns, or can map rank columns to their own order, in which case
+    columns missing from it are ranked ascending.
+    """
+    order, offsets = get_group_offsets(df[by])
+
+    def transform(cols: str | list, kernel, **kwargs) -> np.ndarray:
+        values = df[cols].to_numpy(dtype=np.float64)[order]
+        result = np.empty_like(values)
+        result[order] = kernel(values, offsets, **kwargs)
+        return result
+
+    for col in rank_cols:
+        col_ascending = (
+            ascending.get(col, True) if isinstance(ascending, dict) else ascending
+        )
+        df[f"{col}_rank"] = transform(col, rank_by_group, ascending=col_ascending)
+    for col in zscore_cols:
+        df[f"{col}_zscore"] = transform(col, zscore_by_group)
+    if winsorize_cols:
+        df[winsorize_cols] = transform(
+            winsorize_cols, winsorize_by_group, outlier_cutoff=outlier_cutoff
+        )
+    return df
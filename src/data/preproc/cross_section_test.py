@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.preproc.cross_section import get_cross_sectional_features
+
+
+def zscore(x: pd.Series) -> pd.Series:
+    return (x - x.mean()) / x.std()
+
+
+def winsorize(x: pd.Series, outlier_cutoff: float = 0.01) -> pd.Series:
+    return x.clip(x.quantile(outlier_cutoff), x.quantile(1 - outlier_cutoff))
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    n = 5000
+    df = pd.DataFrame(
+        {
+            "date": rng.integers(0, 100, n),
+            "sector": rng.choice(["a", "b", "c"], n),
+            # Rounded to get ties
+            "x": rng.normal(size=n).round(1),
+            "y": rng.normal(size=n),
+        }
+    )
+    df.loc[rng.random(n) < 0.1, "x"] = np.nan
+    df.loc[df.date == 5, "x"] = np.nan
+    # A single-row date
+    df.loc[0, "date"] = 100
+    return df
+
+
+def test_ranks_match_pandas(df):
+    result = get_cross_sectional_features(
+        df.copy(), rank_cols=["x", "y"], ascending={"x": False}
+    )
+    expected_x = df.groupby("date").x.rank(ascending=False)
+    expected_y = df.groupby("date").y.rank()
+    pd.testing.assert_series_equal(result.x_rank, expected_x, check_names=False)
+    pd.testing.assert_series_equal(result.y_rank, expected_y, check_names=False)
+    assert result.loc[df.date == 5, "x_rank"].isna().all()
+
+
+def test_zscores_match_pandas(df):
+    result = get_cross_sectional_features(df.copy(), zscore_cols=["x"])
+    expected = df.groupby("date").x.transform(zscore)
+    pd.testing.assert_series_equal(result.x_zscore, expected, check_names=False)
+
+
+def test_winsorized_values_match_pandas(df):
+    result = get_cross_sectional_features(df.copy(), winsorize_cols=["x", "y"])
+    for col in ["x", "y"]:
+        expected = df.groupby("date")[col].transform(winsorize)
+        pd.testing.assert_series_equal(result[col], expected)
+
+
+def test_grouping_by_several_keys_matches_pandas(df):
+    result = get_cross_sectional_features(
+        df.copy(), rank_cols=["x"], zscore_cols=["y"], by=["date", "sector"]
+    )
+    grouped = df.groupby(["date", "sector"])
+    pd.testing.assert_series_equal(result.x_rank, grouped.x.rank(), check_names=False)
+    pd.testing.assert_series_equal(
+        result.y_zscore, grouped.y.transform(zscore), check_names=False
+    )
+
+
+def test_empty_frame(df):
+    result = get_cross_sectional_features(
+        df.iloc[:0].copy(), rank_cols=["x"], zscore_cols=["x"], winsorize_cols=["y"]
+    )
+    assert result.empty
+    assert {"x_rank", "x_zscore"} <= set(result.columns)
@@ -2,6 +2,8 @@ import numpy as np
 import pandas as pd
 import talib
 
+from src.data.preproc.cross_section import get_cross_sectional_features
+
 
 def get_currency_volume_and_rank(df: pd.DataFrame) -> pd.DataFrame:
     """Get stock liquidity (21 day rolling average of traded volume) and daily per-stock
@@ -13,35 +15,7 @@ def get_currency_volume_and_rank(df: pd.DataFrame) -> pd.DataFrame:
         .mean()
         .pln_vol
     )
-    df["pln_vol_rank"] = df.groupby("date").pln_vol.rank(ascending=False)
-    return df
-
-
-def get_historical_returns(
-    df: pd.DataFrame,
-    periods: list = [1, 2, 3, 5, 10],
-    outlier_cutoff: float = 0.01,
-) -> pd.DataFrame:
-    """Get returns for multipl historical perdiods.
-
-    Winsorize returns at 1% and 99% levels and normalize with geometric average to get
-    compounded daily returns.
-    """
-    for lag in periods:
-        df[f"return_{lag}d"] = (
-            df.groupby("ticker")
-            .close.pct_change(lag)
-            .pipe(
-                lambda x: x.clip(
-                    lower=x.quantile(outlier_cutoff),
-                    upper=x.quantile(1 - outlier_cutoff),
-                )
-            )
-            .add(1)
-            .pow(1 / lag)
-            .sub(1)
-        )
-    return df
+    return get_cross_sectional_features(df, rank_cols=["pln_vol"], ascending=False)
 
 
 def get_lagged_returns(df: pd.DataFrame) -> pd.DataFrame:
@@ -60,31 +34,59 @@ def get_lagged_market_ops_data(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def get_next_day_return(df: pd.DataFrame, outlier_cutoff: float = 0.01) -> pd.DataFrame:
-    """Get next-day returns, winsorized at 1% and 99% levels."""
-    df["target_next_day_return"] = (
-        df.groupby("ticker")
-        .close.pct_change(1)
-        .pipe(
-            lambda x: x.clip(
-                lower=x.quantile(outlier_cutoff), upper=x.quantile(1 - outlier_cutoff)
-            )
-        )
-        .shift(-1)
+def get_returns_and_momentum(
+    df: pd.DataFrame,
+    periods: list = [1, 2, 3, 5, 10],
+    momentum_periods: list = [2, 3, 5, 10],
+    outlier_cutoff: float = 0.01,
+) -> pd.DataFrame:
+    """Get historical returns, next-day return target and momentum factors at once.
+
+    Returns are computed in one pass over per-ticker close arrays sorted by date: the
+    return over each lag is a difference of cumulative log returns (log close prices).
+    Returns are winsorized at 1% and 99% levels of each date's cross-section and
+    normalized with geometric average to get compounded daily returns. The next-day
+    return target is winsorized the same way. Momentum factors are the differences
+    between returns over longer periods and the most recent return, and between the
+    10-day and 2-day return.
+    """
+    n = len(df)
+    ticker_codes = pd.factorize(df["ticker"])[0]
+    dates = df["date"].to_numpy()
+    code_steps = np.diff(ticker_codes)
+    is_sorted = np.all(code_steps >= 0) and np.all(
+        (code_steps > 0) | (dates[1:] >= dates[:-1])
+    )
+    order = np.arange(n) if is_sorted else np.lexsort((dates, ticker_codes))
+    sorted_codes = ticker_codes[order]
+    is_group_start = np.r_[True, sorted_codes[1:] != sorted_codes[:-1]][:n]
+    positions = np.arange(n)
+    position_in_group = positions - np.maximum.accumulate(
+        np.where(is_group_start, positions, 0)
+    )
+    is_group_end = np.r_[is_group_start[1:], True][:n]
+    inverse_order = np.empty(n, dtype=np.int64)
+    inverse_order[order] = positions
+
+    log_close = np.log(df["close"].to_numpy(dtype=np.float64)[order])
+    return_cols = [f"return_{lag}d" for lag in periods]
+    for lag, col in zip(periods, return_cols):
+        returns = np.full(n, np.nan)
+        returns[lag:] = np.expm1(log_close[lag:] - log_close[:-lag])
+        returns[position_in_group < lag] = np.nan
+        df[col] = returns[inverse_order]
+    df = get_cross_sectional_features(
+        df, winsorize_cols=return_cols, outlier_cutoff=outlier_cutoff
     )
-    return df
-
 
-def get_momentum_factors(
-    df: pd.DataFrame, periods: list = [2, 3, 5, 10]
-) -> pd.DataFrame:
-    """Get momentum factors for multiple historical periods.
+    next_day_returns = np.full(n, np.nan)
+    next_day_returns[:-1] = df["return_1d"].to_numpy()[order][1:]
+    next_day_returns[is_group_end] = np.nan
+    df["target_next_day_return"] = next_day_returns[inverse_order]
 
-    Based on:
-    - Difference between returns over longer periods and the most recent return.
-    - Difference between 10-day and 2-day return.
-    """
-    for lag in periods:
+    for lag, col in zip(periods, return_cols):
+        df[col] = np.power(df[col].to_numpy() + 1, 1 / lag) - 1
+    for lag in momentum_periods:
         df[f"momentum_{lag}d"] = df[f"return_{lag}d"].sub(df.return_1d)
     df["momentum_2_10d"] = df["return_10d"].sub(df.return_2d)
     return df
@@ -199,11 +201,9 @@ def remove_superfluous_columns(df: pd.DataFrame) -> pd.DataFrame:
 
 def engineer_features(df: pd.DataFrame) -> pd.DataFrame:
     df = get_currency_volume_and_rank(df)
-    df = get_historical_returns(df)
+    df = get_returns_and_momentum(df)
     df = get_lagged_returns(df)
     df = get_lagged_market_ops_data(df)
-    df = get_next_day_return(df)
-    df = get_momentum_factors(df)
     df = get_alpha_factors(df)
     df = add_date_features(df)
     df = remove_rows_with_nans(df)
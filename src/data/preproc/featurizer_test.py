@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.preproc.cross_section import get_cross_sectional_features
+from src.data.preproc.featurizer import get_returns_and_momentum
+
+
+def reference_returns_and_momentum(df: pd.DataFrame) -> pd.DataFrame:
+    """Returns, next-day target and momentum computed column by column with pandas."""
+    periods = [1, 2, 3, 5, 10]
+    return_cols = [f"return_{lag}d" for lag in periods]
+    for lag, col in zip(periods, return_cols):
+        df[col] = df.groupby("ticker").close.pct_change(lag)
+    df = get_cross_sectional_features(df, winsorize_cols=return_cols)
+    for lag, col in zip(periods, return_cols):
+        df[col] = df[col].add(1).pow(1 / lag).sub(1)
+
+    df["target_next_day_return"] = df.groupby("ticker").close.pct_change(1)
+    df = get_cross_sectional_features(df, winsorize_cols=["target_next_day_return"])
+    df["target_next_day_return"] = df.groupby("ticker").target_next_day_return.shift(-1)
+
+    for lag in [2, 3, 5, 10]:
+        df[f"momentum_{lag}d"] = df[f"return_{lag}d"].sub(df.return_1d)
+    df["momentum_2_10d"] = df["return_10d"].sub(df.return_2d)
+    return df
+
+
+@pytest.fixture
+def prices() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2023-01-01", "2023-12-31")
+    df = pd.MultiIndex.from_product(
+        [[f"T{i:02d}" for i in range(30)], dates], names=["ticker", "date"]
+    ).to_frame(index=False)
+    df = df.sample(frac=0.9, random_state=0)
+    df["close"] = np.exp(rng.normal(0, 0.03, len(df)).cumsum()) * 10
+    return df.sort_values(["ticker", "date"]).reset_index(drop=True)
+
+
+def assert_frames_close(result: pd.DataFrame, expected: pd.DataFrame) -> None:
+    assert list(result.columns) == list(expected.columns)
+    for col in expected.columns.drop(["ticker", "date"]):
+        np.testing.assert_allclose(result[col], expected[col], rtol=1e-9, atol=1e-12)
+
+
+def test_get_returns_and_momentum_matches_reference(prices):
+    expected = reference_returns_and_momentum(prices.copy())
+    result = get_returns_and_momentum(prices.copy())
+    assert_frames_close(result, expected)
+
+
+def test_get_returns_and_momentum_matches_reference_on_shuffled_input(prices):
+    # The reference relies on rows being sorted by ticker and date, as the cleaner
+    # leaves them
+    shuffled = prices.sample(frac=1, random_state=1)
+    expected = reference_returns_and_momentum(prices.copy()).loc[shuffled.index]
+    result = get_returns_and_momentum(shuffled.copy())
+    assert result.index.equals(shuffled.index)
+    assert_frames_close(result, expected)
+
+
+def test_get_returns_and_momentum_on_empty_frame(prices):
+    expected = reference_returns_and_momentum(prices.iloc[:0].copy())
+    result = get_returns_and_momentum(prices.iloc[:0].copy())
+    assert result.empty
+    assert list(result.columns) == list(expected.columns)
@@ -1,77 +1,110 @@
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
 
 import pandas as pd
 
 from src.data import config
+from src.data.store.fundamentals_store import FundamentalsStore
+from src.data.utils import trading_calendar
 
+# Fundamentals files in merge order, with the biznesradar resource they come from
+FUNDAMENTALS_SOURCES = {
+    "BALANCE_SHEETS_FP": "raporty-finansowe-bilans",
+    "CASH_FLOWS_FP": "raporty-finansowe-przeplywy-pieniezne",
+    "PROFIT_AND_LOSS_FP": "raporty-finansowe-rachunek-zyskow-i-strat",
+    "MARKET_VALUE_IND_FP": "wskazniki-wartosci-rynkowej",
+    "PROFITABILITY_IND_FP": "wskazniki-rentownosci",
+    "CASH_FLOW_IND_FP": "wskazniki-przeplywow-pienieznych",
+    "DEBT_IND_FP": "wskazniki-zadluzenia",
+    "LIQUIDITY_IND_FP": "wskazniki-plynnosci",
+    "ACTIVITY_IND_FP": "wskazniki-aktywnosci",
+}
+PRICES_DTYPES = {"name": str, "isin": str, "currency": str}
+FUNDAMENTALS_DTYPES = {"ticker": str}
 
-def merge_data() -> pd.DataFrame:
-    """Merge all data into one DataFrame."""
-    prices = pd.concat(
-        [
-            pd.read_csv(
-                f"{config.DATA_PATHS['PRICES_DP']}/{file}", parse_dates=["date"]
+
+def _read_timed(fp: str, read_fn: Callable, **kwargs) -> pd.DataFrame:
+    """Read a file and report how long it took."""
+    start = time.perf_counter()
+    df = read_fn(fp, **kwargs)
+    print(f"Loaded {fp} in {time.perf_counter() - start:.2f}s")
+    return df
+
+
+def load_data(max_workers: int = 8) -> tuple[pd.DataFrame, pd.DataFrame, list]:
+    """Load prices, info and fundamentals concurrently.
+
+    Readers release the GIL for much of the parsing, so a thread pool overlaps reading
+    the files. Dates are parsed with a fixed format instead of being inferred.
+    Fundamentals are read from the FundamentalsStore for resources it holds and from
+    their CSV files otherwise.
+
+    Returns:
+        Prices, info and a list of fundamentals in FUNDAMENTALS_SOURCES order, each with
+        its date column renamed to "date".
+    """
+    prices_fps = [
+        f"{config.DATA_PATHS['PRICES_DP']}/{fn}"
+        for fn in os.listdir(config.DATA_PATHS["PRICES_DP"])
+        if fn.endswith(".csv")
+    ]
+    store = FundamentalsStore(config.DATA_PATHS["FUNDAMENTALS_STORE_DP"])
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        prices_futures = [
+            executor.submit(
+                _read_timed,
+                fp,
+                pd.read_csv,
+                dtype=PRICES_DTYPES,
+                parse_dates=["date"],
+                date_format="%Y-%m-%d",
             )
-            for file in [
-                fn
-                for fn in os.listdir(config.DATA_PATHS["PRICES_DP"])
-                if fn.endswith(".csv")
-            ]
+            for fp in prices_fps
         ]
-    )
-    info = pd.read_json(config.DATA_PATHS["INFO_FP"])
-    balance_sheets = pd.read_csv(
-        config.DATA_PATHS["BALANCE_SHEETS_FP"], parse_dates=["Data publikacji"]
-    )
-    cash_flows = pd.read_csv(
-        config.DATA_PATHS["CASH_FLOWS_FP"], parse_dates=["Data publikacji"]
-    )
-    profit_and_loss = pd.read_csv(
-        config.DATA_PATHS["PROFIT_AND_LOSS_FP"], parse_dates=["Data publikacji"]
-    )
-    market_value_ind = pd.read_csv(
-        config.DATA_PATHS["MARKET_VALUE_IND_FP"], parse_dates=["date"]
-    )
-    profitability_ind = pd.read_csv(
-        config.DATA_PATHS["PROFITABILITY_IND_FP"], parse_dates=["date"]
-    )
-    cash_flow_ind = pd.read_csv(
-        config.DATA_PATHS["CASH_FLOW_IND_FP"], parse_dates=["date"]
-    )
-    debt_ind = pd.read_csv(config.DATA_PATHS["DEBT_IND_FP"], parse_dates=["date"])
-    liquidity_ind = pd.read_csv(
-        config.DATA_PATHS["LIQUIDITY_IND_FP"], parse_dates=["date"]
-    )
-    activity_ind = pd.read_csv(
-        config.DATA_PATHS["ACTIVITY_IND_FP"], parse_dates=["date"]
-    )
-
-    df = pd.DataFrame(
-        pd.date_range(prices.date.min(), prices.date.max(), freq="D", name="date")
-    )
+        info_future = executor.submit(
+            _read_timed, config.DATA_PATHS["INFO_FP"], pd.read_json
+        )
+        fundamentals_futures = [
+            (
+                executor.submit(_read_timed, resource, store.load)
+                if store.has_resource(resource)
+                else executor.submit(
+                    _read_timed,
+                    config.DATA_PATHS[path_key],
+                    pd.read_csv,
+                    dtype=FUNDAMENTALS_DTYPES,
+                    parse_dates=[store.get_date_col(resource)],
+                    date_format="%Y-%m-%d",
+                )
+            )
+            for path_key, resource in FUNDAMENTALS_SOURCES.items()
+        ]
+        prices = pd.concat([future.result() for future in prices_futures])
+        info = info_future.result()
+        fundamentals = [
+            future.result().rename(columns={store.get_date_col(resource): "date"})
+            for future, resource in zip(
+                fundamentals_futures, FUNDAMENTALS_SOURCES.values()
+            )
+        ]
+    return prices, info, fundamentals
+
+
+def merge_data() -> pd.DataFrame:
+    """Merge all data into one DataFrame."""
+    prices, info, fundamentals = load_data()
+
+    # Keep any session missing from the calendar rather than dropping its prices
+    trading_days = trading_calendar.get_trading_days(
+        prices.date.min(), prices.date.max()
+    ).union(pd.DatetimeIndex(prices.date.unique(), name="date"))
+    df = pd.DataFrame(trading_days)
     df = df.merge(prices, on="date", how="left")
     df = df.merge(info, on="isin", how="left")
-    df = df.merge(
-        balance_sheets.rename(columns={"Data publikacji": "date"}),
-        on=["date", "ticker"],
-        how="left",
-    )
-    df = df.merge(
-        cash_flows.rename(columns={"Data publikacji": "date"}),
-        on=["date", "ticker"],
-        how="left",
-    )
-    df = df.merge(
-        profit_and_loss.rename(columns={"Data publikacji": "date"}),
-        on=["date", "ticker"],
-        how="left",
-    )
-    df = df.merge(market_value_ind, on=["date", "ticker"], how="left")
-    df = df.merge(profitability_ind, on=["date", "ticker"], how="left")
-    df = df.merge(cash_flow_ind, on=["date", "ticker"], how="left")
-    df = df.merge(debt_ind, on=["date", "ticker"], how="left")
-    df = df.merge(liquidity_ind, on=["date", "ticker"], how="left")
-    df = df.merge(activity_ind, on=["date", "ticker"], how="left")
+    for fundamentals_df in fundamentals:
+        df = df.merge(fundamentals_df, on=["date", "ticker"], how="left")
 
     assert all(
         df.groupby(["date", "ticker"]).count() == 1
@@ -0,0 +1,35 @@
+import pandas as pd
+
+from src.data import config
+from src.data.preproc.joiner import FUNDAMENTALS_SOURCES, load_data
+from src.data.store.fundamentals_store import FundamentalsStore
+
+
+def test_load_data_reads_fundamentals_from_store_when_available(tmp_path, monkeypatch):
+    for key in ["PRICES_DP", "FUNDAMENTALS_STORE_DP"]:
+        monkeypatch.setitem(config.DATA_PATHS, key, str(tmp_path / key))
+    (tmp_path / "PRICES_DP").mkdir()
+    pd.DataFrame({"isin": ["PL1"], "close": [1.0], "date": ["2024-01-02"]}).to_csv(
+        tmp_path / "PRICES_DP" / "2024-01.csv", index=False
+    )
+    monkeypatch.setitem(config.DATA_PATHS, "INFO_FP", str(tmp_path / "info.json"))
+    pd.DataFrame([{"isin": "PL1", "ticker": "001"}]).to_json(tmp_path / "info.json")
+
+    store = FundamentalsStore(config.DATA_PATHS["FUNDAMENTALS_STORE_DP"])
+    for i, (key, resource) in enumerate(FUNDAMENTALS_SOURCES.items()):
+        df = pd.DataFrame(
+            {store.get_date_col(resource): ["2024-01-02"], "ticker": ["001"], "x": [i]}
+        )
+        if i % 2:
+            store.upsert(df, resource)
+        else:
+            monkeypatch.setitem(config.DATA_PATHS, key, str(tmp_path / f"{key}.csv"))
+            df.to_csv(tmp_path / f"{key}.csv", index=False)
+
+    _, _, fundamentals = load_data()
+
+    for i, df in enumerate(fundamentals):
+        assert set(df.columns) == {"date", "ticker", "x"}
+        assert df["x"].tolist() == [i]
+        assert df["ticker"].tolist() == ["001"]
+        assert df["date"].tolist() == [pd.Timestamp("2024-01-02")]
@@ -10,6 +10,7 @@ from pandas import DataFrame
 from tqdm import tqdm
 
 from src.data.scrapers.base_table_scraper import BaseTableScraper
+from src.data.utils import trading_calendar
 
 
 class WSEPriceScraper(BaseTableScraper):
@@ -66,11 +67,7 @@ class WSEPriceScraper(BaseTableScraper):
             date_start (str): Start date in format YYYY-MM-DD.
             date_end (str): End date in format YYYY-MM-DD.
         """
-        dates = [
-            date
-            for date in pd.date_range(start=date_start, end=date_end, freq="D")
-            if date.day_name() not in ["Saturday", "Sunday"]
-        ]
+        dates = trading_calendar.get_trading_days(date_start, date_end)
         df_list = [self.get_prices_for_date(date) for date in tqdm(dates)]
         return pd.concat(df_list, ignore_index=True)
 
@@ -0,0 +1,228 @@
+import os
+from collections import OrderedDict
+from io import BytesIO
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from src.data import config
+
+
+class FeatureStore:
+    """Point-in-time queries over the featurized data by ticker and date.
+
+    An index of the byte offset of every (ticker, date) row and the column dtypes of the
+    whole file are kept next to the featurized CSV, so queries seek to and parse only
+    the rows they need instead of loading the whole history. The index is sorted by
+    ticker and date, so each ticker's date range is found with a binary search. It is
+    rebuilt whenever the CSV changes and hot queries are served from an LRU cache
+    bounded by the total number of cached rows.
+    """
+
+    SCHEMA_CHUNK_ROWS = 100_000
+
+    def __init__(
+        self,
+        fp: str = config.DATA_PATHS["FEATURIZED_DATA_FP"],
+        max_cached_rows: int = 100_000,
+    ):
+        self.fp = fp
+        self.index_fp = f"{os.path.splitext(fp)[0]}_index.csv"
+        self.schema_fp = f"{os.path.splitext(fp)[0]}_schema.csv"
+        self.max_cached_rows = max_cached_rows
+        self._cache: OrderedDict[tuple, DataFrame] = OrderedDict()
+        self._cached_rows = 0
+        self._index_mtime: Optional[float] = None
+        self._load_index()
+
+    @staticmethod
+    def _merge_dtypes(left: np.dtype, right: np.dtype) -> np.dtype:
+        """Get the dtype pd.read_csv gives a column read in one go from the dtypes of
+        two of its chunks."""
+        if left == right:
+            return left
+        if left == object or right == object or np.dtype(bool) in (left, right):
+            return np.dtype(object)
+        return np.result_type(left, right)
+
+    def _build_index(self) -> tuple[DataFrame, dict]:
+        """Scan the featurized CSV for row offsets and column dtypes and save them."""
+        keys, dtypes = [], {}
+        for chunk in pd.read_csv(
+            self.fp,
+            dtype={"ticker": str},
+            parse_dates=["date"],
+            date_format="%Y-%m-%d",
+            chunksize=self.SCHEMA_CHUNK_ROWS,
+        ):
+            keys.append(chunk[["ticker", "date"]])
+            for col, dtype in chunk.dtypes.items():
+                dtypes[col] = self._merge_dtypes(dtypes.get(col, dtype), dtype)
+        offsets, lengths = [], []
+        with open(self.fp, "rb") as f:
+            offset = len(f.readline())
+            for line in f:
+                offsets.append(offset)
+                lengths.append(len(line))
+                offset += len(line)
+        index = pd.concat(keys, ignore_index=True).assign(
+            offset=offsets, length=lengths
+        )
+        index = index.sort_values(["ticker", "date"]).reset_index(drop=True)
+        schema = {col: dtype.name for col, dtype in dtypes.items() if col != "date"}
+        index.to_csv(self.index_fp, index=False)
+        pd.Series(schema, name="dtype").rename_axis("column").to_csv(self.schema_fp)
+        return index, schema
+
+    def _load_index(self) -> None:
+        """Load the index and schema, rebuilding them if the featurized CSV is newer."""
+        data_mtime = os.path.getmtime(self.fp)
+        if all(
+            os.path.exists(fp) and os.path.getmtime(fp) >= data_mtime
+            for fp in [self.index_fp, self.schema_fp]
+        ):
+            self._index = pd.read_csv(
+                self.index_fp,
+                dtype={"ticker": str},
+                parse_dates=["date"],
+                date_format="%Y-%m-%d",
+            )
+            schema = pd.read_csv(self.schema_fp, index_col="column")["dtype"].to_dict()
+        else:
+            self._index, schema = self._build_index()
+        # Object columns are read as str so that e.g. ticker "001" stays a string
+        self._dtypes = {
+            col: str if dtype == "object" else dtype for col, dtype in schema.items()
+        }
+        tickers = self._index["ticker"].to_numpy()
+        is_start = np.r_[True, tickers[1:] != tickers[:-1]][: len(tickers)]
+        starts = np.flatnonzero(is_start)
+        self._ticker_ranges = dict(
+            zip(tickers[starts], zip(starts, np.r_[starts[1:], len(tickers)]))
+        )
+        self._dates = self._index["date"].to_numpy()
+        with open(self.fp, "rb") as f:
+            self._header = f.readline()
+        self._index_mtime = data_mtime
+        self._clear_cache()
+
+    def _clear_cache(self) -> None:
+        self._cache.clear()
+        self._cached_rows = 0
+
+    def _refresh(self) -> None:
+        if os.path.getmtime(self.fp) != self._index_mtime:
+            self._load_index()
+
+    def _read_rows(self, rows: np.ndarray) -> DataFrame:
+        """Read index rows from the featurized CSV, merging adjacent rows into a single
+        read."""
+        selected = self._index.iloc[rows].sort_values("offset")
+        chunks = [self._header]
+        with open(self.fp, "rb") as f:
+            start, end = None, None
+            for offset, length in zip(selected["offset"], selected["length"]):
+                if offset != end:
+                    if start is not None:
+                        f.seek(start)
+                        chunks.append(f.read(end - start))
+                    start = offset
+                end = offset + length
+            if start is not None:
+                f.seek(start)
+                chunks.append(f.read(end - start))
+        df = pd.read_csv(
+            BytesIO(b"".join(chunks)),
+            dtype=self._dtypes,
+            parse_dates=["date"],
+            date_format="%Y-%m-%d",
+        )
+        return df.sort_values(["ticker", "date"]).reset_index(drop=True)
+
+    def _query_uncached(
+        self,
+        tickers: Optional[tuple],
+        date_start: Optional[pd.Timestamp],
+        date_end: Optional[pd.Timestamp],
+        latest: bool,
+    ) -> DataFrame:
+        ranges = (
+            self._ticker_ranges.values()
+            if tickers is None
+            else [self._ticker_ranges[t] for t in tickers if t in self._ticker_ranges]
+        )
+        rows = []
+        for start, end in ranges:
+            dates = self._dates[start:end]
+            if date_start is not None:
+                start += np.searchsorted(dates, np.datetime64(date_start), "left")
+            if date_end is not None:
+                end = start + np.searchsorted(
+                    self._dates[start:end], np.datetime64(date_end), "right"
+                )
+            if start < end:
+                rows.append(np.arange(end - 1 if latest else start, end))
+        return self._read_rows(np.concatenate(rows) if rows else np.array([], int))
+
+    def _query(
+        self,
+        tickers: Optional[list],
+        date_start: Optional[str] = None,
+        date_end: Optional[str] = None,
+        latest: bool = False,
+    ) -> DataFrame:
+        self._refresh()
+        key = (
+            tuple(sorted(tickers)) if tickers is not None else None,
+            pd.to_datetime(date_start) if date_start is not None else None,
+            pd.to_datetime(date_end) if date_end is not None else None,
+            latest,
+        )
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key].copy()
+        df = self._query_uncached(*key)
+        # Large results, e.g. the whole history, would crowd out the hot queries
+        if len(df) <= self.max_cached_rows:
+            self._cache[key] = df
+            self._cached_rows += len(df)
+            while self._cached_rows > self.max_cached_rows:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached_rows -= len(evicted)
+        return df.copy()
+
+    def get_features(
+        self,
+        tickers: Optional[list] = None,
+        date_start: Optional[str] = None,
+        date_end: Optional[str] = None,
+    ) -> DataFrame:
+        """Get features in a date range, inclusive.
+
+        Args:
+            tickers (list): Tickers to get, defaults to all.
+            date_start (str): Start date in format YYYY-MM-DD, defaults to the first.
+            date_end (str): End date in format YYYY-MM-DD, defaults to the last.
+        """
+        return self._query(tickers, date_start=date_start, date_end=date_end)
+
+    def get_features_as_of(
+        self, date: str, tickers: Optional[list] = None
+    ) -> DataFrame:
+        """Get the most recent features of each ticker available on a given date.
+
+        Args:
+            date (str): Date in format YYYY-MM-DD.
+            tickers (list): Tickers to get, defaults to all.
+        """
+        return self._query(tickers, date_end=date, latest=True)
+
+    def get_latest_features(self, tickers: Optional[list] = None) -> DataFrame:
+        """Get the latest features of each ticker.
+
+        Args:
+            tickers (list): Tickers to get, defaults to all.
+        """
+        return self._query(tickers, latest=True)
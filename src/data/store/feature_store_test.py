@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.store.feature_store import FeatureStore
+
+
+@pytest.fixture
+def featurized_fp(tmp_path) -> str:
+    dates = pd.bdate_range("2024-01-01", periods=6)
+    df = pd.MultiIndex.from_product(
+        [["001", "ABC", "XYZ"], dates], names=["ticker", "date"]
+    ).to_frame(index=False)
+    df["alpha"] = np.arange(len(df)) / 10
+    df["day_in_month"] = df.date.dt.day
+    df["is_monday"] = df.date.dt.dayofweek == 0
+    # Empty for the first ticker, only filled in further down the file
+    df["note"] = np.where(df.ticker == "001", None, "txt")
+    fp = tmp_path / "featurized.csv"
+    df.to_csv(fp, index=False)
+    return str(fp)
+
+
+@pytest.fixture
+def store(featurized_fp, monkeypatch) -> FeatureStore:
+    # Read the schema in chunks smaller than the first ticker's history
+    monkeypatch.setattr(FeatureStore, "SCHEMA_CHUNK_ROWS", 4)
+    return FeatureStore(featurized_fp)
+
+
+@pytest.fixture
+def features(featurized_fp) -> pd.DataFrame:
+    return pd.read_csv(featurized_fp, dtype={"ticker": str}, parse_dates=["date"])
+
+
+def test_dtypes_match_reading_the_whole_file(store, features):
+    result = store.get_latest_features(["001"])
+    assert result.dtypes.to_dict() == features.dtypes.to_dict()
+    assert result.ticker.tolist() == ["001"]
+
+
+def test_dtypes_survive_reloading_the_saved_schema(store, featurized_fp, features):
+    reloaded = FeatureStore(featurized_fp)
+    assert reloaded.get_features().dtypes.to_dict() == features.dtypes.to_dict()
+
+
+def test_get_latest_features(store, features):
+    expected = features.groupby("ticker").tail(1).reset_index(drop=True)
+    pd.testing.assert_frame_equal(store.get_latest_features(), expected)
+
+
+def test_get_features_as_of(store, features):
+    expected = features[features.date <= "2024-01-03"].groupby("ticker").tail(1)
+    result = store.get_features_as_of("2024-01-03", tickers=["XYZ", "001"])
+    pd.testing.assert_frame_equal(
+        result, expected[expected.ticker != "ABC"].reset_index(drop=True)
+    )
+
+
+def test_get_features_as_of_before_first_date_is_empty(store):
+    assert store.get_features_as_of("2023-12-31").empty
+
+
+def test_get_features_in_date_range(store, features):
+    expected = features[
+        (features.ticker == "ABC") & features.date.between("2024-01-02", "2024-01-04")
+    ].reset_index(drop=True)
+    result = store.get_features(["ABC", "MISSING"], "2024-01-02", "2024-01-04")
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_large_results_are_not_cached(featurized_fp):
+    store = FeatureStore(featurized_fp, max_cached_rows=3)
+    store.get_features()
+    store.get_latest_features()
+    assert store._cached_rows == 3
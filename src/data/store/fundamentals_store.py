@@ -0,0 +1,193 @@
+import os
+from datetime import datetime
+from typing import Optional
+
+import pandas as pd
+from pandas import DataFrame
+
+from src.data import config
+from src.data.utils import pandas as pandas_utils
+
+
+class FundamentalsStore:
+    """Deduplicated store of fundamentals scraped from biznesradar.
+
+    Rows are keyed on (ticker, resource, report date) and identified by a hash of their
+    values, so a re-scraped report history only writes rows that are new or revised.
+    Every write is recorded in a revision log under an incrementing run id. Once a
+    resource has been upserted, the joiner loads it from the store instead of its
+    legacy CSV.
+    """
+
+    ROW_HASH_COL = "row_hash"
+    REVISION_LOG_COLUMNS = [
+        "run_id",
+        "timestamp",
+        "resource",
+        "ticker",
+        "report_date",
+        "change",
+        "row_hash",
+        "previous_row_hash",
+    ]
+
+    def __init__(self, store_dp: str = config.DATA_PATHS["FUNDAMENTALS_STORE_DP"]):
+        self.store_dp = store_dp
+        self.revision_log_fp = os.path.join(store_dp, "revisions.csv")
+        os.makedirs(store_dp, exist_ok=True)
+
+    def _get_resource_fp(self, resource: str) -> str:
+        return os.path.join(self.store_dp, f"{resource}.csv")
+
+    def has_resource(self, resource: str) -> bool:
+        """Check whether any data has been stored for a resource."""
+        return os.path.exists(self._get_resource_fp(resource))
+
+    @staticmethod
+    def get_date_col(resource: str) -> str:
+        """Get the report date column: indicators are dated by the scraper, financial
+        statements by their publication date."""
+        return "date" if "wskazniki-" in resource else "Data publikacji"
+
+    @staticmethod
+    def _normalize_values(col: pd.Series) -> pd.Series:
+        """Get values as strings, equal for equal numbers such as 1, 1.0 and "1", and
+        for missing values such as NaN and None."""
+        numeric = pd.to_numeric(col, errors="coerce").astype(float)
+        text = col.astype(str).where(col.notna(), "")
+        return numeric.astype(str).where(numeric.notna(), text)
+
+    @classmethod
+    def _hash_rows(cls, df: DataFrame, key_cols: list) -> pd.Series:
+        """Hash column names and normalized values of each row, independently of column
+        order and of the dtypes the values were read with."""
+        value_cols = sorted(
+            (col for col in df.columns if col not in key_cols + [cls.ROW_HASH_COL]),
+            key=str,
+        )
+        labelled = DataFrame(
+            {col: f"{col}=" + cls._normalize_values(df[col]) for col in value_cols},
+            index=df.index,
+        )
+        return pd.util.hash_pandas_object(labelled, index=False).astype(str)
+
+    def _read_revision_log(self) -> DataFrame:
+        if not os.path.exists(self.revision_log_fp):
+            return DataFrame(columns=self.REVISION_LOG_COLUMNS)
+        return pd.read_csv(self.revision_log_fp, dtype=str).astype({"run_id": int})
+
+    def new_run_id(self) -> int:
+        """Get the id of the next run, one above the last logged run."""
+        run_ids = self._read_revision_log()["run_id"]
+        return int(run_ids.max()) + 1 if len(run_ids) else 1
+
+    def upsert(
+        self, df: DataFrame, resource: str, run_id: Optional[int] = None
+    ) -> DataFrame:
+        """Write new and revised rows of a scraped report history.
+
+        Rows without a report date cannot be keyed and are skipped. Duplicate column
+        labels are numbered as in rename_duplicate_columns. Returns the revision log
+        entries written by this call.
+
+        Args:
+            df (DataFrame): Scraped data, e.g. from BiznesradarScraper.
+            resource (str): Biznesradar resource the data was scraped from.
+            run_id (int): Run to log the changes under, defaults to a new run.
+        """
+        run_id = self.new_run_id() if run_id is None else run_id
+        date_col = self.get_date_col(resource)
+        key_cols = ["ticker", date_col]
+
+        incoming = pandas_utils.rename_duplicate_columns(df.copy())
+        incoming[date_col] = pd.to_datetime(incoming[date_col]).dt.strftime("%Y-%m-%d")
+        incoming = incoming.dropna(subset=key_cols).drop_duplicates(
+            subset=key_cols, keep="last"
+        )
+        incoming[self.ROW_HASH_COL] = self._hash_rows(incoming, key_cols)
+
+        resource_fp = self._get_resource_fp(resource)
+        if os.path.exists(resource_fp):
+            stored = pd.read_csv(resource_fp, dtype=str)
+        else:
+            stored = DataFrame(columns=key_cols + [self.ROW_HASH_COL])
+
+        compared = incoming[key_cols + [self.ROW_HASH_COL]].merge(
+            stored[key_cols + [self.ROW_HASH_COL]],
+            on=key_cols,
+            how="left",
+            suffixes=("", "_previous"),
+        )
+        previous_hash = compared[f"{self.ROW_HASH_COL}_previous"]
+        is_new = previous_hash.isna().values
+        is_changed = is_new | (compared[self.ROW_HASH_COL] != previous_hash).values
+
+        changes = DataFrame(
+            {
+                "run_id": run_id,
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "resource": resource,
+                "ticker": compared["ticker"].values,
+                "report_date": compared[date_col].values,
+                "change": ["new" if new else "revised" for new in is_new],
+                "row_hash": compared[self.ROW_HASH_COL].values,
+                "previous_row_hash": previous_hash.values,
+            },
+            columns=self.REVISION_LOG_COLUMNS,
+        )[is_changed]
+        if changes.empty:
+            return changes.reset_index(drop=True)
+
+        changed = incoming[is_changed]
+        stored_keys = pd.MultiIndex.from_frame(stored[key_cols])
+        changed_keys = pd.MultiIndex.from_frame(changed[key_cols])
+        stored = pd.concat([stored[~stored_keys.isin(changed_keys)], changed])
+        # Log first: if the rows were stored without their log entries, the next run
+        # would see matching hashes and never log them
+        changes.to_csv(
+            self.revision_log_fp,
+            mode="a",
+            header=not os.path.exists(self.revision_log_fp),
+            index=False,
+        )
+        tmp_fp = f"{resource_fp}.tmp"
+        stored.sort_values(key_cols).to_csv(tmp_fp, index=False)
+        os.replace(tmp_fp, resource_fp)
+        return changes.reset_index(drop=True)
+
+    def load(self, resource: str, tickers: Optional[list] = None) -> DataFrame:
+        """Load stored data for a resource, optionally only for some tickers.
+
+        Args:
+            resource (str): Biznesradar resource.
+            tickers (list): Tickers to load, defaults to all.
+        """
+        date_col = self.get_date_col(resource)
+        df = pd.read_csv(
+            self._get_resource_fp(resource),
+            dtype={"ticker": str, self.ROW_HASH_COL: str},
+            parse_dates=[date_col],
+            date_format="%Y-%m-%d",
+        )
+        if tickers is not None:
+            df = df[df["ticker"].isin(tickers)]
+        return df.drop(columns=self.ROW_HASH_COL).reset_index(drop=True)
+
+    def get_changes_since(
+        self, run_id: int, resource: Optional[str] = None
+    ) -> DataFrame:
+        """Get revision log entries written after a given run.
+
+        Args:
+            run_id (int): Last run already processed downstream.
+            resource (str): Biznesradar resource, defaults to all.
+        """
+        log = self._read_revision_log()
+        log = log[log["run_id"] > run_id]
+        if resource is not None:
+            log = log[log["resource"] == resource]
+        return log.reset_index(drop=True)
+
+    def get_changed_tickers(self, run_id: int, resource: Optional[str] = None) -> list:
+        """Get tickers with new or revised rows after a given run."""
+        return sorted(self.get_changes_since(run_id, resource)["ticker"].unique())
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.store.fundamentals_store import FundamentalsStore
+
+RESOURCE = "wskazniki-rentownosci"
+
+
+@pytest.fixture
+def store(tmp_path) -> FundamentalsStore:
+    return FundamentalsStore(str(tmp_path / "store"))
+
+
+@pytest.fixture
+def scraped() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ROE": ["1.5", "2", np.nan],
+            "ROA": ["0.1", "0.2", "-"],
+            "date": pd.to_datetime(["2020-03-31", "2020-06-30", "2020-09-30"]),
+            "ticker": "ABC",
+        }
+    )
+
+
+def test_upsert_logs_new_rows(store, scraped):
+    changes = store.upsert(scraped, RESOURCE)
+    assert changes["change"].tolist() == ["new"] * 3
+    assert changes["run_id"].tolist() == [1] * 3
+    assert store.load(RESOURCE)["date"].tolist() == scraped["date"].tolist()
+
+
+def test_upsert_skips_unchanged_rows(store, scraped):
+    store.upsert(scraped, RESOURCE)
+    assert store.upsert(scraped.iloc[::-1], RESOURCE).empty
+
+
+def test_upsert_skips_rows_read_back_with_other_dtypes(store, scraped):
+    store.upsert(scraped, RESOURCE)
+    assert store.upsert(store.load(RESOURCE), RESOURCE).empty
+
+
+def test_upsert_logs_revised_and_new_rows(store, scraped):
+    first = store.upsert(scraped, RESOURCE)
+    revised = scraped.copy()
+    revised.loc[1, "ROE"] = "2.1"
+    revised.loc[3] = ["3", "1", pd.Timestamp("2020-12-31"), "ABC"]
+
+    changes = store.upsert(revised, RESOURCE)
+
+    assert changes["report_date"].tolist() == ["2020-06-30", "2020-12-31"]
+    assert changes["change"].tolist() == ["revised", "new"]
+    assert changes["previous_row_hash"].iloc[0] == first["row_hash"].iloc[1]
+    stored = store.load(RESOURCE)
+    assert len(stored) == 4
+    assert stored.loc[stored["date"] == "2020-06-30", "ROE"].item() == 2.1
+
+
+def test_upsert_logs_renamed_column_as_revision(store, scraped):
+    store.upsert(scraped, RESOURCE)
+    changes = store.upsert(scraped.rename(columns={"ROA": "ROA2"}), RESOURCE)
+    assert changes["change"].tolist() == ["revised"] * 3
+
+
+def test_upsert_handles_duplicate_column_labels(store, scraped):
+    duplicated = scraped.rename(columns={"ROA": "ROE"})
+    store.upsert(duplicated, RESOURCE)
+    assert store.upsert(duplicated, RESOURCE).empty
+    assert set(store.load(RESOURCE).columns) == {"ROE", "ROE_1", "date", "ticker"}
+
+
+def test_upsert_skips_rows_without_report_date(store):
+    statement = pd.DataFrame(
+        {
+            "Data publikacji": ["2020-05-01", None],
+            "Przychody": ["1", "2"],
+            "ticker": "X",
+        }
+    )
+    changes = store.upsert(statement, "raporty-finansowe-bilans")
+    assert changes["report_date"].tolist() == ["2020-05-01"]
+
+
+def test_get_changes_since(store, scraped):
+    store.upsert(scraped, RESOURCE)
+    other = scraped.assign(ticker="XYZ")
+    store.upsert(other, RESOURCE)
+    store.upsert(other.assign(ROE="9"), "wskazniki-zadluzenia")
+
+    changes = store.get_changes_since(1)
+
+    assert changes["run_id"].tolist() == [2] * 3 + [3] * 3
+    assert store.get_changed_tickers(1) == ["XYZ"]
+    assert store.get_changed_tickers(0, RESOURCE) == ["ABC", "XYZ"]
+    assert store.get_changes_since(3).empty
+    assert store.new_run_id() == 4
@@ -1,3 +1,5 @@
+import hashlib
+
 import pandas as pd
 from pandas import DataFrame
 
@@ -10,19 +12,39 @@ def replace_header_with_top_row(df: DataFrame) -> DataFrame:
     return df
 
 
+def _get_column_digest(column: pd.Series) -> bytes:
+    """Get a digest of a column's dtype and values."""
+    values_hash = pd.util.hash_pandas_object(column, index=False).to_numpy()
+    return hashlib.blake2b(
+        str(column.dtype).encode() + values_hash.tobytes(), digest_size=16
+    ).digest()
+
+
 def drop_duplicate_columns(df: DataFrame) -> DataFrame:
-    """Drop duplicate columns from a DataFrame."""
-    duplicates = df.T.duplicated()
-    return df.T[~duplicates].T
+    """Drop duplicate columns from a DataFrame.
+
+    Columns are compared by a digest of their dtype and values, so the frame is never
+    transposed and keeps its dtypes. Digest matches are confirmed with an exact
+    comparison. Unlike comparing the transposed frame, columns with equal values but
+    different dtypes (e.g. int 1 and float 1.0) are not duplicates.
+    """
+    kept: dict[bytes, list[int]] = {}
+    keep_mask = []
+    for i in range(df.shape[1]):
+        column = df.iloc[:, i]
+        candidates = kept.setdefault(_get_column_digest(column), [])
+        is_duplicate = any(column.equals(df.iloc[:, j]) for j in candidates)
+        if not is_duplicate:
+            candidates.append(i)
+        keep_mask.append(not is_duplicate)
+    return df.loc[:, keep_mask]
 
 
 def rename_duplicate_columns(df: DataFrame) -> DataFrame:
     """Rename duplicate columns in a DataFrame."""
     cols = pd.Series(df.columns)
-    for dup in df.columns[df.columns.duplicated(keep=False)]:
-        cols[df.columns.get_loc(dup)] = [
-            f"{dup}_{i}" if i != 0 else dup
-            for i in range(df.columns.get_loc(dup).sum())
-        ]
-    df.columns = cols
+    occurrence = cols.groupby(cols, dropna=False).cumcount()
+    df.columns = cols.where(
+        occurrence == 0, cols.astype(str) + "_" + occurrence.astype(str)
+    )
     return df
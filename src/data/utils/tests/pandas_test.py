@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from src.data.utils import pandas as pandas_utils
+
+
+def test_drop_duplicate_columns_keeps_dtypes():
+    df = pd.DataFrame({"a": [1, 2], "b": [1.5, 2.5], "c": ["x", "y"], "d": [1, 2]})
+    result = pandas_utils.drop_duplicate_columns(df)
+    assert list(result.columns) == ["a", "b", "c"]
+    assert result.dtypes.to_dict() == df[["a", "b", "c"]].dtypes.to_dict()
+
+
+def test_drop_duplicate_columns_treats_nans_as_equal():
+    df = pd.DataFrame({"a": [1.0, np.nan], "b": [1.0, np.nan], "c": [np.nan, 1.0]})
+    assert list(pandas_utils.drop_duplicate_columns(df).columns) == ["a", "c"]
+
+
+def test_drop_duplicate_columns_keeps_equal_values_of_different_dtypes():
+    df = pd.DataFrame({"a": [1, 2], "b": [1.0, 2.0]})
+    assert list(pandas_utils.drop_duplicate_columns(df).columns) == ["a", "b"]
+
+
+def test_drop_duplicate_columns_with_duplicate_labels():
+    df = pd.DataFrame([[1, 1, 2]], columns=["a", "a", "a"])
+    result = pandas_utils.drop_duplicate_columns(df)
+    assert result.shape == (1, 2)
+    assert result.iloc[0].tolist() == [1, 2]
+
+
+def test_rename_duplicate_columns():
+    df = pd.DataFrame([[1, 2, 3, 4]], columns=["a", "b", "a", "a"])
+    result = pandas_utils.rename_duplicate_columns(df)
+    assert list(result.columns) == ["a", "b", "a_1", "a_2"]
+
+
+def test_rename_duplicate_columns_with_nan_labels():
+    df = pd.DataFrame([[1, 2, 3]], columns=[np.nan, "a", np.nan])
+    result = pandas_utils.rename_duplicate_columns(df)
+    assert pd.isna(result.columns[0])
+    assert list(result.columns[1:]) == ["a", "nan_1"]
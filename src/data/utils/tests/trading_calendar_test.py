@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+
+from src.data.utils import trading_calendar
+
+
+@pytest.mark.parametrize(
+    "day",
+    [
+        "2023-04-07",  # Good Friday
+        "2023-04-10",  # Easter Monday
+        "2023-06-08",  # Corpus Christi
+        "2024-03-29",  # Good Friday
+        "2024-04-01",  # Easter Monday
+        "2024-05-30",  # Corpus Christi
+        "2025-04-18",  # Good Friday
+        "2025-04-21",  # Easter Monday
+        "2025-06-19",  # Corpus Christi
+        "2011-01-06",  # Epiphany, a holiday since 2011
+        "2018-11-12",  # Ad-hoc closure
+        "2024-01-01",
+        "2024-05-01",
+        "2024-05-03",
+        "2024-08-15",
+        "2024-11-01",
+        "2024-11-11",
+        "2024-12-24",
+        "2024-12-25",
+        "2024-12-26",
+        "2024-12-31",
+        "2024-06-01",  # Saturday
+        "2024-06-02",  # Sunday
+    ],
+)
+def test_closed_days(day):
+    assert not trading_calendar.is_trading_day(day)
+    assert pd.Timestamp(day) not in trading_calendar.get_trading_days(day, day)
+
+
+@pytest.mark.parametrize(
+    "day",
+    [
+        "2010-01-06",  # Epiphany, before it became a holiday
+        "2019-11-12",  # Day of the 2018 ad-hoc closure in another year
+        "2024-03-28",  # Day before Good Friday
+        "2024-04-02",  # Day after Easter Monday
+        "2024-12-23",
+        "2024-12-27",
+        "2025-01-02",
+    ],
+)
+def test_trading_days(day):
+    assert trading_calendar.is_trading_day(day)
+    assert pd.Timestamp(day) in trading_calendar.get_trading_days(day, day)
+
+
+def test_get_trading_days_across_years_matches_is_trading_day():
+    days = pd.date_range("2023-12-01", "2025-01-31", freq="D")
+    expected = [day for day in days if trading_calendar.is_trading_day(day)]
+    result = trading_calendar.get_trading_days("2023-12-01", "2025-01-31")
+    assert list(result) == expected
+    assert result.name == "date"
+
+
+def test_get_trading_days_with_empty_range():
+    assert trading_calendar.get_trading_days("2024-01-05", "2024-01-04").empty
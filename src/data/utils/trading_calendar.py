@@ -0,0 +1,84 @@
+from datetime import date, timedelta
+from functools import lru_cache
+
+import pandas as pd
+from pandas import DatetimeIndex, Timestamp
+
+# Sessions cancelled outside of the regular holiday schedule
+AD_HOC_CLOSURES = [
+    date(2018, 11, 12),  # 100th anniversary of Polish independence
+]
+
+
+def _get_easter_sunday(year: int) -> date:
+    """Get Easter Sunday for a given year (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+@lru_cache(maxsize=None)
+def get_holidays_for_year(year: int) -> tuple[date, ...]:
+    """Get days on which the Warsaw Stock Exchange is closed in a given year."""
+    easter = _get_easter_sunday(year)
+    holidays = [
+        date(year, 1, 1),
+        easter - timedelta(days=2),  # Good Friday
+        easter + timedelta(days=1),  # Easter Monday
+        date(year, 5, 1),
+        date(year, 5, 3),
+        easter + timedelta(days=60),  # Corpus Christi
+        date(year, 8, 15),
+        date(year, 11, 1),
+        date(year, 11, 11),
+        date(year, 12, 24),
+        date(year, 12, 25),
+        date(year, 12, 26),
+        date(year, 12, 31),
+    ]
+    if year >= 2011:
+        holidays.append(date(year, 1, 6))
+    holidays += [day for day in AD_HOC_CLOSURES if day.year == year]
+    return tuple(sorted(holidays))
+
+
+@lru_cache(maxsize=None)
+def _get_trading_days_for_year(year: int) -> DatetimeIndex:
+    return pd.bdate_range(
+        start=f"{year}-01-01",
+        end=f"{year}-12-31",
+        freq="C",
+        holidays=get_holidays_for_year(year),
+        name="date",
+    )
+
+
+def get_trading_days(date_start, date_end) -> DatetimeIndex:
+    """Get Warsaw Stock Exchange trading days in a given date range, inclusive.
+
+    Args:
+        date_start: Start date, anything accepted by pd.to_datetime.
+        date_end: End date, anything accepted by pd.to_datetime.
+    """
+    start = pd.to_datetime(date_start).normalize()
+    end = pd.to_datetime(date_end).normalize()
+    if start > end:
+        return DatetimeIndex([], name="date")
+    trading_days = _get_trading_days_for_year(start.year).append(
+        [_get_trading_days_for_year(y) for y in range(start.year + 1, end.year + 1)]
+    )
+    return trading_days[(trading_days >= start) & (trading_days <= end)]
+
+
+def is_trading_day(day) -> bool:
+    """Check whether the Warsaw Stock Exchange is open on a given day."""
+    day = Timestamp(day)
+    return day.weekday() < 5 and day.date() not in get_holidays_for_year(day.year)